@@ -19,42 +19,46 @@
 
 import * as fs from 'fs';
 import * as path from 'path';
-import * as os from 'os';
 import { spawn } from 'child_process';
 import { ArgumentParser } from 'argparse';
 
 // === Constants ===============================================================
 
 const DEFAULT_CONTRACT_ID = 'CD6HGS5V7XJPSPJ5HHPHUZXLYGZAJJC3L6QWR4YZG4NIRO65UYQ6KIYP';
-const REPO_ROOT = path.resolve(__dirname, '..', '..');
+// Compiled output lives one level deeper (dist/), so step over it when
+// locating the repository root.
+const SCRIPT_DIR = path.basename(__dirname) === 'dist' ? path.dirname(__dirname) : __dirname;
+const REPO_ROOT = path.resolve(SCRIPT_DIR, '..', '..');
 const DEFAULT_DATASET_DIR = path.resolve(REPO_ROOT, 'tests', 'simple_circuit', 'target');
 
 // === Data loading / packing ==================================================
 
 interface PackedArtifacts {
+  publicInputsPath: string;
+  proofPath: string;
   publicInputsBytes: Buffer;
   proofBytes: Buffer;
+  proofFields: number;
+  publicInputFields: number;
 }
 
-function getProofFields(artifacts: PackedArtifacts): number {
-  if (artifacts.proofBytes.length % 32 !== 0) {
-    throw new Error('Proof blob is not a multiple of 32 bytes.');
-  }
-  return artifacts.proofBytes.length / 32;
-}
-
-function getPublicInputFields(artifacts: PackedArtifacts): number {
-  if (artifacts.publicInputsBytes.length % 32 !== 0) {
-    throw new Error('Public inputs are not a multiple of 32 bytes.');
+async function readArtifact(file: string, label: string): Promise<Buffer> {
+  // Let the open report a missing file rather than stat-ing it beforehand.
+  try {
+    return await fs.promises.readFile(file);
+  } catch (exc: any) {
+    if (exc.code === 'ENOENT') {
+      throw new Error(`${label} not found: ${file}`);
+    }
+    throw exc;
   }
-  return artifacts.publicInputsBytes.length / 32;
 }
 
-function loadArtifacts(
+async function loadArtifacts(
   dataset: string | null,
   publicInputs: string | null,
   proof: string | null
-): PackedArtifacts {
+): Promise<PackedArtifacts> {
   let datasetDir = dataset ?? DEFAULT_DATASET_DIR;
   if (!path.isAbsolute(datasetDir)) {
     datasetDir = path.resolve(process.cwd(), datasetDir);
@@ -66,16 +70,29 @@ function loadArtifacts(
   const resolvedPublicInputs = path.resolve(publicInputsPath);
   const resolvedProof = path.resolve(proofPath);
 
-  if (!fs.existsSync(resolvedPublicInputs)) {
-    throw new Error(`public inputs not found: ${resolvedPublicInputs}`);
+  // Issue both reads up front so they overlap on the libuv thread pool
+  // instead of blocking the event loop one after the other.
+  const [publicInputsBytes, proofBytes] = await Promise.all([
+    readArtifact(resolvedPublicInputs, 'public inputs'),
+    readArtifact(resolvedProof, 'proof'),
+  ]);
+
+  // Validate the 32-byte framing once here so a bad artifact fails before
+  // anything is printed or invoked.
+  if (proofBytes.length % 32 !== 0) {
+    throw new Error('Proof blob is not a multiple of 32 bytes.');
   }
-  if (!fs.existsSync(resolvedProof)) {
-    throw new Error(`proof not found: ${resolvedProof}`);
+  if (publicInputsBytes.length % 32 !== 0) {
+    throw new Error('Public inputs are not a multiple of 32 bytes.');
   }
 
   return {
-    publicInputsBytes: fs.readFileSync(resolvedPublicInputs),
-    proofBytes: fs.readFileSync(resolvedProof),
+    publicInputsPath: resolvedPublicInputs,
+    proofPath: resolvedProof,
+    publicInputsBytes,
+    proofBytes,
+    proofFields: proofBytes.length / 32,
+    publicInputFields: publicInputsBytes.length / 32,
   };
 }
 
@@ -111,28 +128,35 @@ function runCommand(cmd: string[], dryRun: boolean): Promise<CommandResult> {
       stdio: ['inherit', 'pipe', 'pipe'],
     });
 
-    let stdout = '';
-    let stderr = '';
+    // Forward chunks to the terminal as raw bytes and only decode once the
+    // process exits, so multi-byte characters split across chunks survive.
+    const stdoutChunks: Buffer[] = [];
+    const stderrChunks: Buffer[] = [];
 
     proc.stdout?.on('data', (data: Buffer) => {
-      const text = data.toString();
-      stdout += text;
-      process.stdout.write(text);
+      stdoutChunks.push(data);
+      process.stdout.write(data);
     });
 
     proc.stderr?.on('data', (data: Buffer) => {
-      const text = data.toString();
-      stderr += text;
-      process.stderr.write(text);
+      stderrChunks.push(data);
+      process.stderr.write(data);
     });
 
     proc.on('close', (code) => {
-      resolve({ returncode: code ?? 1, stdout, stderr });
+      resolve({
+        returncode: code ?? 1,
+        stdout: Buffer.concat(stdoutChunks).toString(),
+        stderr: Buffer.concat(stderrChunks).toString(),
+      });
     });
 
     proc.on('error', (err) => {
-      stderr += err.message;
-      resolve({ returncode: 1, stdout, stderr });
+      resolve({
+        returncode: 1,
+        stdout: Buffer.concat(stdoutChunks).toString(),
+        stderr: Buffer.concat(stderrChunks).toString() + err.message,
+      });
     });
   });
 }
@@ -173,14 +197,14 @@ async function invokeWithVariants(
 function printSummary(artifacts: PackedArtifacts): void {
   console.log('public inputs bytes:', artifacts.publicInputsBytes.length);
   console.log('proof bytes:', artifacts.proofBytes.length);
-  console.log('proof fields:', getProofFields(artifacts));
-  console.log('public input fields:', getPublicInputFields(artifacts));
-  console.log('total fields:', getProofFields(artifacts) + getPublicInputFields(artifacts));
+  console.log('proof fields:', artifacts.proofFields);
+  console.log('public input fields:', artifacts.publicInputFields);
+  console.log('total fields:', artifacts.proofFields + artifacts.publicInputFields);
 }
 
 async function commandPrepare(args: any): Promise<number> {
   try {
-    const artifacts = loadArtifacts(args.dataset, args.public_inputs, args.proof);
+    const artifacts = await loadArtifacts(args.dataset, args.public_inputs, args.proof);
     printSummary(artifacts);
 
     return 0;
@@ -192,7 +216,7 @@ async function commandPrepare(args: any): Promise<number> {
 
 async function commandInvoke(args: any): Promise<number> {
   try {
-    const artifacts = loadArtifacts(args.dataset, args.public_inputs, args.proof);
+    const artifacts = await loadArtifacts(args.dataset, args.public_inputs, args.proof);
     printSummary(artifacts);
 
     const baseCmd: string[] = [
@@ -213,25 +237,17 @@ async function commandInvoke(args: any): Promise<number> {
       baseCmd.push('--cost');
     }
 
-    const tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'ultrahonk-'));
-    try {
-      const publicInputsFile = path.join(tmpDir, 'public_inputs.bin');
-      fs.writeFileSync(publicInputsFile, artifacts.publicInputsBytes);
-      const proofFile = path.join(tmpDir, 'proof.bin');
-      fs.writeFileSync(proofFile, artifacts.proofBytes);
-
-      const verifyArgs = [
-        '--public_inputs-file-path',
-        publicInputsFile,
-        '--proof_bytes-file-path',
-        proofFile,
-      ];
-      const result = await invokeWithVariants(baseCmd, 'verify_proof', verifyArgs, args.dry_run);
-      if (result.returncode !== 0) {
-        return result.returncode;
-      }
-    } finally {
-      fs.rmSync(tmpDir, { recursive: true, force: true });
+    // The artifacts are already raw bytes on disk; hand the CLI their paths
+    // directly instead of copying them into a temporary directory first.
+    const verifyArgs = [
+      '--public_inputs-file-path',
+      artifacts.publicInputsPath,
+      '--proof_bytes-file-path',
+      artifacts.proofPath,
+    ];
+    const result = await invokeWithVariants(baseCmd, 'verify_proof', verifyArgs, args.dry_run);
+    if (result.returncode !== 0) {
+      return result.returncode;
     }
 
     return 0;
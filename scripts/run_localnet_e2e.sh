@@ -81,7 +81,7 @@ echo "Deployed contract id: $CONTRACT_ID"
 
 echo "Invoking verify_proof via helper script..."
 cd "$ROOT_DIR"
-npx ts-node scripts/invoke_ultrahonk/invoke_ultrahonk.ts invoke \
+npx ts-node --transpile-only scripts/invoke_ultrahonk/invoke_ultrahonk.ts invoke \
   --dataset "$DATASET_DIR" \
   --contract-id "$CONTRACT_ID" \
   --network "$NETWORK_NAME" \